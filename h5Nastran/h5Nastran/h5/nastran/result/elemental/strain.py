@@ -835,6 +835,7 @@ class QUAD4(ResultTable, ShellElementStrainResultTable):
     table_def.add_index_option('MATERIAL', None)
     table_def.add_index_option('FIBER', None)
     table_def.add_index_option('VONM', DataGetter(indices=[0, 2, 3, 4, 5, 10, 11, 12, 13]))
+    table_def.add_index_option('MAXS', DataGetter(indices=[0, 2, 3, 4, 5, 10, 11, 12, 13]))
 
 
 ########################################################################################################################
@@ -843,6 +844,7 @@ class QUAD4(ResultTable, ShellElementStrainResultTable):
 class QUAD4_COMP(ResultTable):
     result_type = 'ELEMENT STRAINS 95 QUAD4LC REAL'
     table_def = TableDef.create('/NASTRAN/RESULT/ELEMENTAL/STRAIN/QUAD4_COMP', result_type)
+    table_def.op2_num_wide = 11
 
 
 ########################################################################################################################
@@ -1275,9 +1277,11 @@ class TETRA_CPLX(ResultTable):
 class TRIA3(ResultTable, ShellElementStrainResultTable):
     result_type = 'ELEMENT STRAINS 74 TRIA3 REAL'
     table_def = TableDef.create('/NASTRAN/RESULT/ELEMENTAL/STRAIN/TRIA3', result_type)
+    table_def.op2_num_wide = 17
     table_def.add_index_option('MATERIAL', None)
     table_def.add_index_option('FIBER', None)
     table_def.add_index_option('VONM', DataGetter(indices=[0, 2, 3, 4, 5, 10, 11, 12, 13]))
+    table_def.add_index_option('MAXS', DataGetter(indices=[0, 2, 3, 4, 5, 10, 11, 12, 13]))
 
 ########################################################################################################################
 
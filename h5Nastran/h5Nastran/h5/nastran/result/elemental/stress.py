@@ -834,6 +834,7 @@ class QUAD4(ResultTable, ShellElementForceStressResultTable):
     table_def = TableDef.create('/NASTRAN/RESULT/ELEMENTAL/STRESS/QUAD4', result_type)
     table_def.add_index_option('EFFE', DataGetter(indices=[0, 2, 3, 4, 5, 10, 11, 12, 13]))
     table_def.add_index_option('VONM', DataGetter(indices=[0, 2, 3, 4, 5, 10, 11, 12, 13]))
+    table_def.add_index_option('MAXS', DataGetter(indices=[0, 2, 3, 4, 5, 10, 11, 12, 13]))
 
 
 ########################################################################################################################
@@ -842,6 +843,7 @@ class QUAD4(ResultTable, ShellElementForceStressResultTable):
 class QUAD4_COMP(ResultTable):
     result_type = 'ELEMENT STRESSES 95 QUAD4LC REAL'
     table_def = TableDef.create('/NASTRAN/RESULT/ELEMENTAL/STRESS/QUAD4_COMP', result_type)
+    table_def.op2_num_wide = 11
 
 
 ########################################################################################################################
@@ -970,6 +972,7 @@ class QUADR(ResultTable, ShellElementForceStressResultTable):
 class QUADR_COMP(ResultTable):
     result_type = 'ELEMENT STRESSES 232 QUADRLC REAL'
     table_def = TableDef.create('/NASTRAN/RESULT/ELEMENTAL/STRESS/QUADR_COMP', result_type)
+    table_def.op2_num_wide = 11
 
 
 ########################################################################################################################
@@ -1274,8 +1277,10 @@ class TETRA_NL(ResultTable):
 class TRIA3(ResultTable, ShellElementForceStressResultTable):
     result_type = 'ELEMENT STRESSES 74 TRIA3 REAL'
     table_def = TableDef.create('/NASTRAN/RESULT/ELEMENTAL/STRESS/TRIA3', result_type)
+    table_def.op2_num_wide = 17
     table_def.add_index_option('EFFE', DataGetter(indices=[0, 2, 3, 4, 5, 10, 11, 12, 13]))
     table_def.add_index_option('VONM', DataGetter(indices=[0, 2, 3, 4, 5, 10, 11, 12, 13]))
+    table_def.add_index_option('MAXS', DataGetter(indices=[0, 2, 3, 4, 5, 10, 11, 12, 13]))
 
 
 ########################################################################################################################
@@ -1300,6 +1305,7 @@ class TRIA3_3FDNL(ResultTable):
 class TRIA3_COMP(ResultTable):
     result_type = 'ELEMENT STRESSES 97 TRIA3LC REAL'
     table_def = TableDef.create('/NASTRAN/RESULT/ELEMENTAL/STRESS/TRIA3_COMP', result_type)
+    table_def.op2_num_wide = 11
 
 
 ########################################################################################################################
@@ -1412,6 +1418,7 @@ class TRIAR(ResultTable, ShellElementForceStressResultTable):
 class TRIAR_COMP(ResultTable):
     result_type = 'ELEMENT STRESSES 233 TRIARLC REAL'
     table_def = TableDef.create('/NASTRAN/RESULT/ELEMENTAL/STRESS/TRIAR_COMP', result_type)
+    table_def.op2_num_wide = 11
 
 
 ########################################################################################################################
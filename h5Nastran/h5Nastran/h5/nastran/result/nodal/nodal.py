@@ -1,5 +1,7 @@
 from __future__ import print_function, absolute_import
 
+import numpy as np
+from six import iteritems
 from six.moves import range
 
 from h5Nastran.h5nastrannode import H5NastranNode
@@ -32,20 +34,31 @@ class Displacement(ResultTable):
 ########################################################################################################################
 
 
+# this is done so that when doing grid point force summation, only nids and eids need
+# to be considered
+_grid_force_eids = {
+    b'F-OF-SPC': -1,
+    b'F-OF-MPC': -2,
+    b'APP-LOAD': -3,
+    b'*TOTALS*': -4
+}
+
+
 def _validator(data):
     if data[1] == b'':
         data[1] = 0
 
-    # this is done so that when doing grid point force summation, only nids and eids need
-    # to be considered
-    eids = {
-        b'F-OF-SPC': -1,
-        b'F-OF-MPC': -2,
-        b'APP-LOAD': -3,
-        b'*TOTALS*': -4
-    }
+    data[1] = _grid_force_eids.get(data[2].strip(), data[1])
+
+    return data
+
+
+def _op2_validator(data):
+    elname = np.char.strip(data['ELNAME'])
+    eid = data['EID']
 
-    data[1] = eids.get(data[2].strip(), data[1])
+    for _elname, _eid in iteritems(_grid_force_eids):
+        eid[elname == _elname] = _eid
 
     return data
 
@@ -54,7 +67,8 @@ class GridForce(ResultTable):
     result_type = 'GRID POINT FORCE BALANCE REAL'
     table_def = TableDef.create('/NASTRAN/RESULT/NODAL/GRID_FORCE', result_type,
                                 indices=DataGetter(indices=[0, 2, 3, 5, 6, 7, 8, 9, 10]),
-                                validator=_validator
+                                validator=_validator,
+                                op2_validator=_op2_validator
                                 )
     
     def search(self, data_ids, domains=(), convert_to_basic=False):
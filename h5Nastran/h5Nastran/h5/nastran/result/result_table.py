@@ -11,6 +11,7 @@ from typing import List
 
 from h5Nastran.msc import data_tables
 from h5Nastran.post_process.result_readers.punch import PunchTableData
+from h5Nastran.post_process.result_readers.op2 import OP2TableData
 from h5Nastran.versioning import VersioningMetaClass, VersioningData
 from .result_data import ResultData
 
@@ -193,6 +194,15 @@ class DataGetter(object):
         return result
 
 
+def _get_op2_index(index, offset):
+    """converts the index of a punch field to the index of the op2 word"""
+    if isinstance(index, list):
+        return [_get_op2_index(i, offset) for i in index]
+    if isinstance(index, DefinedValue) or index == 0:
+        return index
+    return index - offset
+
+
 def _get_data(data, index):
     if isinstance(index, (int, slice)):
         return data[index]
@@ -215,7 +225,7 @@ class TableDef(object):
 
     @classmethod
     def create(cls, table_def, results_type, indices=None, validator=None, len_id=None, pos_id=None, subtables=None, rename=None,
-               is_subtable=False):
+               is_subtable=False, op2_validator=None):
         if isinstance(table_def, str):
             table_def = data_tables[table_def]
         try:
@@ -233,10 +243,10 @@ class TableDef(object):
         if subtables is None:
             subtables = [TableDef.create(data_tables[_], '', rename=rename, is_subtable=True) for _ in table_def.subtables]
         return cls(table_def.name, table_def.path, results_type, index_id, dtype, indices, validator,
-                   len_id, pos_id, subtables, rename, is_subtable=is_subtable)
+                   len_id, pos_id, subtables, rename, is_subtable=is_subtable, op2_validator=op2_validator)
 
     def __init__(self, table_id, group, results_type, index_id, dtype, indices, validator=None,
-                 len_id=None, pos_id=None, subtables=None, rename=None, is_subtable=False):
+                 len_id=None, pos_id=None, subtables=None, rename=None, is_subtable=False, op2_validator=None):
         self.implemented = True
         self.table_id = table_id
         self.group = group
@@ -309,6 +319,16 @@ class TableDef(object):
 
         self.validator = validator
 
+        # the op2 validator gets the whole structured array instead of a row
+        if op2_validator is None:
+            op2_validator = _validator
+
+        self.op2_validator = op2_validator
+
+        # number of words in the real op2 rows; only needed when the table doesn't use the trailing
+        # words of the row (e.g., the angle/major/minor/von mises of the shell stresses)
+        self.op2_num_wide = None
+
         try:
             self.Format = tables.descr_from_dtype(self.dtype)[0]
         except NotImplementedError:
@@ -336,6 +356,9 @@ class TableDef(object):
         self._index_offset = 0
 
         self._subcase_ids = set()
+
+        self._pending_domain_id = None
+        self._pending_index_ids = []
         
         self._index_options = {}
         
@@ -414,26 +437,7 @@ class TableDef(object):
 
         options = data.header.options
 
-        indices = self.indices
-
-        for option in options:
-            try:
-                _indices = self._index_options[option]
-                if _indices is not None:
-                    indices = _indices
-            except KeyError:
-                msg = """
-                Result table '%s' is not supported!
-                A parameter in your bdf file directed Nastran to output the result table with an option that is
-                currently not supported.  This option might affect the format of the results file.  H5Nastran
-                needs to know the format.
-                This requires the following to be added to the result table definition:
-                table_def.add_index_option('%s', new_format)
-                where new_format might simply be None (no change to default format).
-                See RESULT/ELEMENTAL/STRESS/QUAD4 in the source code for an example.
-                Please create a new issue on github.com/SteveDoyle2/pyNastran to request this format to be supported.
-                """ % (data.header.results_type, option)
-                raise H5NastranException(msg)
+        indices = self._get_option_indices(options, data.header.results_type)
 
         data_ = data.data
 
@@ -477,8 +481,101 @@ class TableDef(object):
 
         self.write_data(result_data)
 
+    def _get_option_indices(self, options, results_type):
+        indices = self.indices
+
+        for option in options:
+            try:
+                _indices = self._index_options[option]
+                if _indices is not None:
+                    indices = _indices
+            except KeyError:
+                msg = """
+                Result table '%s' is not supported!
+                A parameter in your bdf file directed Nastran to output the result table with an option that is
+                currently not supported.  This option might affect the format of the results file.  H5Nastran
+                needs to know the format.
+                This requires the following to be added to the result table definition:
+                table_def.add_index_option('%s', new_format)
+                where new_format might simply be None (no change to default format).
+                See RESULT/ELEMENTAL/STRESS/QUAD4 in the source code for an example.
+                Please create a new issue on github.com/SteveDoyle2/pyNastran to request this format to be supported.
+                """ % (results_type, option)
+                raise H5NastranException(msg)
+
+        return indices
+
     def write_op2_data(self, data):
-        raise NotImplementedError
+        assert isinstance(data, OP2TableData)
+
+        header = data.header
+
+        # the op2 options are set from the table flags (e.g., von mises/max shear), so an option that
+        # isn't defined for the table doesn't change the format
+        options = set(option for option in header.options if option in self._index_options)
+
+        indices = self._get_option_indices(options, header.results_type)
+
+        # the op2 rows are the punch rows without the 8 character field after the id, which is only
+        # used for the grid type of the nodal results
+        if header.has_grid_type:
+            offset = 0
+        else:
+            offset = 1
+
+        words = data.data
+        num_wide = words.shape[1]
+
+        names = list(self.dtype.names)
+
+        op2_indices = [_get_op2_index(index, offset) for index in indices.indices]
+
+        # check that the op2 format matches the table before writing anything; the row must have
+        # the real width of the table (e.g., the complex rows and the rows with corner/grid results
+        # have a different number of words)
+        layout_width = 0
+        for name, index in zip(names, op2_indices):
+            if isinstance(index, DefinedValue):
+                continue
+            base = self.dtype[name].base
+            if base.kind == 'S':
+                nwords = base.itemsize // 4
+            else:
+                nwords = 1
+            layout_width = max(layout_width, np.max(index) + nwords)
+        if self.op2_num_wide is not None:
+            layout_width = self.op2_num_wide
+        if layout_width != num_wide:
+            return False
+
+        result = np.empty(words.shape[0], dtype=self.dtype)
+
+        for name, index in zip(names, op2_indices):
+            base = self.dtype[name].base
+            if isinstance(index, DefinedValue):
+                result[name] = index.value
+            elif base.kind == 'S':
+                nwords = base.itemsize // 4
+                result[name] = words[:, index:index + nwords].copy().view(base)[:, 0]
+            elif base.kind == 'f':
+                result[name] = words[:, index].view('<f4')
+            else:
+                result[name] = words[:, index]
+
+        # the op2 ids are 10 * id + device_code
+        result[names[0]] //= 10
+
+        result_data = ResultData()
+        result_data.data = self.op2_validator(result)
+        result_data.options.update(options)
+
+        result_data.set_result_type(header.results_type_basic)
+        result_data.subcase_id = header.subcase_id
+        result_data.op2_results()
+
+        self.write_data(result_data)
+
+        return True
 
     def write_data(self, data):
         assert isinstance(data, ResultData)
@@ -594,7 +691,25 @@ class TableDef(object):
         if self.is_subtable:
             return
 
-        serialized_data = serialize_indices(data[self.index_id][:])
+        domain_id = data['DOMAIN_ID'][0]
+
+        # the results of a domain can be written in several chunks (e.g., a large op2 table), which share an index
+        if domain_id != self._pending_domain_id:
+            self._flush_data_indices()
+            self._pending_domain_id = domain_id
+
+        self._pending_index_ids.append(np.array(data[self.index_id], dtype='i8'))
+
+    def _flush_data_indices(self):
+        if len(self._pending_index_ids) == 0:
+            return
+
+        ids = np.concatenate(self._pending_index_ids)
+
+        self._pending_domain_id = None
+        del self._pending_index_ids[:]
+
+        serialized_data = serialize_indices(ids)
 
         index_data = serialized_data.astype(dtype=private_index_data_format_dtype)
 
@@ -615,7 +730,7 @@ class TableDef(object):
             self._index_data.append(index_data)
             self._subcase_index.append((index_data_offset, index_data.shape[0], self._index_offset))
 
-        self._index_offset += data.shape[0]
+        self._index_offset += ids.shape[0]
 
     def _write_index(self):
         if self.is_subtable:
@@ -659,6 +774,8 @@ class TableDef(object):
         if self.is_subtable:
             return
 
+        self._flush_data_indices()
+
         identity, data = self._get_private_index_tables()
 
         identity.append(np.array(self._subcase_index, dtype=private_index_format_dtype))
@@ -677,7 +794,38 @@ class TableDef(object):
 
 
 def serialize_indices(data):
-    return serialize_data_dict(get_data_dict(data))
+    """
+    Serializes the row indices of each id as [id, count, indices..., id, count, indices..., ...],
+    where the ids are in the order they're first found in data.  This is the same as
+    serialize_data_dict(get_data_dict(data)).
+    """
+    data = np.asarray(data, dtype='i8')
+
+    if data.shape[0] == 0:
+        return serialize_data_dict(get_data_dict(data))
+
+    unique_ids, first, inverse, counts = np.unique(data, return_index=True, return_inverse=True,
+                                                   return_counts=True)
+
+    # the rank of each unique id in the order they're found
+    order = np.argsort(first)
+    rank = np.empty(order.shape[0], dtype='i8')
+    rank[order] = np.arange(order.shape[0])
+    counts = counts[order]
+
+    starts = np.cumsum(counts) - counts
+    positions = 2 * np.arange(counts.shape[0]) + starts
+
+    serialized = np.empty(data.shape[0] + 2 * counts.shape[0], dtype='i8')
+    serialized[positions] = unique_ids[order]
+    serialized[positions + 1] = counts
+
+    data_rank = rank[inverse]
+    rows = np.argsort(data_rank, kind='stable')
+    row_rank = data_rank[rows]
+    serialized[positions[row_rank] + 2 + np.arange(rows.shape[0]) - starts[row_rank]] = rows
+
+    return serialized
 
 
 def get_data_dict(data):
@@ -884,7 +1032,8 @@ class ResultTable(object):
         self._table_def.write_punch_data(data)
 
     def write_op2_data(self, data):
-        self._table_def.write_op2_data(data)
+        # type: (OP2TableData) -> bool
+        return self._table_def.write_op2_data(data)
 
     def write_data(self, data):
         self._table_def.write_data(data)
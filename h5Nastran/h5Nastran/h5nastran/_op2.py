@@ -4,7 +4,7 @@ from collections import OrderedDict
 
 from ._result_base import H5NastranResultBase
 
-# from h5Nastran.post_process.result_readers.punch import PunchReader
+from h5Nastran.post_process.result_readers.op2 import OP2Reader
 
 import numpy as np
 import tables
@@ -26,11 +26,13 @@ class H5NastranResultOP2(H5NastranResultBase):
             raise Exception('F06 file has already been loaded.  Cannot load op2 file after f06.')
 
         self._op2 = filename
+        self._punch_subcase_ids.clear()
 
-        # TODO: need OP2Reader
+        # the result tables are streamed to the h5 tables in chunks, so the op2 is never fully in memory
         reader = OP2Reader(filename)
         reader.register_callback(self._load_op2_table)
         reader.read()
+        reader.close()
 
         self.h5f.flush()
 
@@ -39,15 +41,20 @@ class H5NastranResultOP2(H5NastranResultBase):
 
         self._tables.clear()
         self._write_unsupported_tables()
+        self._write_subcase_table()
 
     def _load_op2_table(self, table_data):
-        result_type = table_data.result_type
+        key = table_data.header.subcase_id_num, table_data.header.load_factor
 
-        table = self._result_tables.get(result_type, None)
+        if key not in self._punch_subcase_ids:
+            self._punch_subcase_ids[key] = len(self._punch_subcase_ids) + 1
 
-        if table is None:
-            return self._unsupported_table(table_data)
+        results_type = table_data.header.results_type_basic
+
+        table = self._result_tables.get(results_type, None)
 
-        table.write_op2_data(table_data)
+        # the data is None for the tables the reader doesn't support (e.g., complex results)
+        if table is None or table_data.data is None or not table.write_op2_data(table_data):
+            return self._unsupported_table(table_data)
 
         self._tables.add(table)
@@ -6,10 +6,6 @@ from ._result_base import H5NastranResultBase
 
 from h5Nastran.post_process.result_readers.punch import PunchReader
 
-import numpy as np
-import tables
-from six import iteritems
-
 
 class H5NastranResultPunch(H5NastranResultBase):
     def __init__(self, *args, **kwargs):
@@ -39,29 +35,7 @@ class H5NastranResultPunch(H5NastranResultBase):
         self._punch_finalize()
 
     def _punch_finalize(self):
-        dtype = np.dtype([('SUBCASE_ID', '<i8'), ('LOAD_FACTOR', '<f8'), ('DOMAIN_ID', '<i8')])
-        format = tables.descr_from_dtype(dtype)[0]
-
-        self.h5f.create_table(self.table_paths.subcase_path, self.table_paths.subcase_table, format,
-                              'SUBCASES', expectedrows=len(self._punch_subcase_ids), createparents=True)
-
-        table = self.h5f.get_node(self.table_paths.subcase)
-
-        data = np.zeros(len(self._punch_subcase_ids), dtype=dtype)
-        subcase_id = data['SUBCASE_ID']
-        load_factor = data['LOAD_FACTOR']
-        domain_id = data['DOMAIN_ID']
-
-        for key, domain_id_ in iteritems(self._punch_subcase_ids):
-            index = domain_id_ - 1
-            subcase_id_, load_factor_ = key
-            subcase_id[index] = subcase_id_
-            load_factor[index] = load_factor_
-            domain_id[index] = domain_id_
-
-        table.append(data)
-
-        self.h5f.flush()
+        self._write_subcase_table()
 
     def _load_punch_table(self, table_data):
         key = table_data.header.subcase_id_num, table_data.header.load_factor
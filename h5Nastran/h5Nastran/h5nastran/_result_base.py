@@ -78,3 +78,28 @@ class H5NastranResultBase(H5NastranBase):
         self.h5f.create_array(self.table_paths.unsupported_result_tables_path,
                               self.table_paths.unsupported_result_tables_table, obj=data,
                               title='UNSUPPORTED RESULT TABLES', createparents=True)
+
+    def _write_subcase_table(self):
+        dtype = np.dtype([('SUBCASE_ID', '<i8'), ('LOAD_FACTOR', '<f8'), ('DOMAIN_ID', '<i8')])
+        format = tables.descr_from_dtype(dtype)[0]
+
+        self.h5f.create_table(self.table_paths.subcase_path, self.table_paths.subcase_table, format,
+                              'SUBCASES', expectedrows=len(self._punch_subcase_ids), createparents=True)
+
+        table = self.h5f.get_node(self.table_paths.subcase)
+
+        data = np.zeros(len(self._punch_subcase_ids), dtype=dtype)
+        subcase_id = data['SUBCASE_ID']
+        load_factor = data['LOAD_FACTOR']
+        domain_id = data['DOMAIN_ID']
+
+        for key, domain_id_ in iteritems(self._punch_subcase_ids):
+            index = domain_id_ - 1
+            subcase_id_, load_factor_ = key
+            subcase_id[index] = subcase_id_
+            load_factor[index] = load_factor_
+            domain_id[index] = domain_id_
+
+        table.append(data)
+
+        self.h5f.flush()
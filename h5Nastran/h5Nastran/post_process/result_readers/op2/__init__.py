@@ -1,3 +1,4 @@
 from __future__ import print_function, absolute_import
 
 from ._op2_reader import OP2Reader
+from ._table_data import OP2TableData
@@ -0,0 +1,121 @@
+from __future__ import print_function, absolute_import
+
+import os
+from struct import Struct
+
+
+class FileReader(object):
+    """
+    Reads the Fortran records of a 32-bit OP2 file.
+
+    A marker is a 4 byte integer written as [4, value, 4].  A record is a marker
+    with the number of words followed by one or more blocks [nbytes, data, nbytes].
+    Nastran splits long records into several blocks, which are read one at a time
+    (see iter_record), so a record never has to be in memory all at once.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+
+        self.filesize = os.path.getsize(self.filename)
+
+        self.f = open(self.filename, 'rb')
+
+        tmp = self.f.read(4)
+
+        if tmp == b'\x04\x00\x00\x00':
+            self.endian = '<'
+        elif tmp == b'\x00\x00\x00\x04':
+            self.endian = '>'
+        elif tmp in (b'\x08\x00\x00\x00', b'\x00\x00\x00\x08'):
+            raise NotImplementedError('%s is a 64-bit op2 file, which is not supported!' % self.filename)
+        else:
+            raise Exception('%s is not a valid op2 file!' % self.filename)
+
+        self.f.seek(0)
+
+        self._struct_i = Struct(self.endian + 'i')
+        self._struct_3i = Struct(self.endian + '3i')
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        try:
+            self.f.close()
+        except AttributeError:
+            pass
+
+        self.f = None
+
+    def tell(self):
+        return self.f.tell()
+
+    def read_marker(self):
+        data = self.f.read(12)
+
+        if len(data) < 12:
+            return None
+
+        n1, value, n2 = self._struct_3i.unpack(data)
+
+        if n1 != 4 or n2 != 4:
+            raise Exception('Error reading op2 file %s!  Expected a marker at position %d.' % (
+                self.filename, self.f.tell() - 12))
+
+        return value
+
+    def peek_marker(self):
+        position = self.f.tell()
+        value = self.read_marker()
+        self.f.seek(position)
+        return value
+
+    def read_markers(self, markers):
+        for marker in markers:
+            value = self.read_marker()
+            if value != marker:
+                raise Exception('Error reading op2 file %s!  Expected marker %s, found %s at position %d.' % (
+                    self.filename, marker, value, self.f.tell() - 12))
+
+    def _read_block_size(self):
+        return self._struct_i.unpack(self.f.read(4))[0]
+
+    def read_block(self):
+        nbytes = self._read_block_size()
+        data = self.f.read(nbytes)
+        nbytes2 = self._read_block_size()
+        assert len(data) == nbytes == nbytes2, (len(data), nbytes, nbytes2)
+        return data
+
+    def skip_block(self):
+        nbytes = self._read_block_size()
+        self.f.seek(nbytes, 1)
+        nbytes2 = self._read_block_size()
+        assert nbytes == nbytes2, (nbytes, nbytes2)
+
+    def iter_record(self):
+        """yields the blocks of the next record"""
+        self.read_marker()
+        yield self.read_block()
+
+        # a positive marker means the record is continued in another block
+        while True:
+            marker = self.peek_marker()
+            if marker is None or marker <= 0:
+                break
+            self.read_marker()
+            yield self.read_block()
+
+    def read_record(self):
+        return b''.join(self.iter_record())
+
+    def skip_record(self):
+        self.read_marker()
+        self.skip_block()
+
+        while True:
+            marker = self.peek_marker()
+            if marker is None or marker <= 0:
+                break
+            self.read_marker()
+            self.skip_block()
@@ -2,8 +2,17 @@ from __future__ import print_function, absolute_import
 from six import iteritems, itervalues
 from six.moves import range
 
+import numpy as np
+
 from ._file_reader import FileReader
-from ._table_data import PunchTableData
+from ._table_data import OP2HeaderData, OP2TableData
+
+
+# the result tables that are read; everything else (geometry, matrices, ...) is skipped
+_result_table_prefixes = (b'OUG', b'BOUG', b'OPG', b'BOPG', b'OQG', b'OQMG', b'OGPF', b'OES', b'OSTR', b'OEF')
+
+# the length of the table 3 (ident) record
+_table3_nbytes = 584
 
 
 def _default_callback(table_data):
@@ -11,8 +20,16 @@ def _default_callback(table_data):
 
 
 class OP2Reader(object):
-    def __init__(self, filename):
-        self.file = None  # fortran format reader
+    """
+    Streams the result tables of an OP2 file to a callback.
+
+    Only a chunk of chunk_size rows of a table 4 (data) record is in memory at a time;
+    the callback is called with an OP2TableData for each chunk.  The tables that can't be
+    read are passed to the callback once per subtable with data=None.
+    """
+    def __init__(self, filename, chunk_size=100000):
+        self.file = FileReader(filename)
+        self.chunk_size = chunk_size
         self._done_reading = False
         self._callback = _default_callback
 
@@ -24,35 +41,154 @@ class OP2Reader(object):
         self.file.close()
 
     def read(self):
-        self._done_reading = True  # remove this when done writing code
+        self._read_header()
 
         while not self._done_reading:
-            data = self._read_data_block()  # reads a table, matrix, whatever
-            # data is a class of OP2Table, OP2Matrix, whatever... classes that don't exist yet
-            # which are subclasses of ResultTableData
-
-            # ResultTableData.data should be a numpy array, can be in memory if possible
-            # but in general should be a numpy.memmap array
-            # table/matrix formats are determined by ident tables
-            # the data from the ident tables is used in a lookup table that will return the appropriate dtype
-            # the lookup data can be defined in a comma delimited file
-
-            # if data is result data, then it should be sorted by subcase if not already SORT1
-            # this would be tricky though since each result table would be an element, for example,
-            # and all element result tables haven't been read yet... they're passed over to the h5n db;
-            # might be able to do this in pytables when done reading op2... just need to be able to
-            # write the correct domains for each element's subcase
-
-            # TODO: in future if geometry tables are to be read, then it doesn't make sense
-            #       to subclass from ResultTableData; maybe should be moved and renamed to
-            #       TableData or something
-            self._callback(data)
+            table_name = self._read_table_name()
+
+            if table_name is None:
+                self._done_reading = True
+                break
+
+            if table_name.startswith(_result_table_prefixes):
+                self._read_result_table(table_name)
+            else:
+                self._skip_table()
 
     def _read_header(self):
-        pass
+        f = self.file
+
+        marker = f.peek_marker()
+
+        # PARAM,POST,-2 files start with the first table
+        if marker == 2:
+            return
+
+        if marker != 3:
+            raise Exception('Error reading op2 file %s!  Unknown header marker %s.' % (f.filename, marker))
+
+        # PARAM,POST,-1
+        f.read_markers([3])
+        f.read_block()  # date
+        f.read_markers([7])
+        f.read_block()  # 'NASTRAN FORT TAPE ID CODE - '
+        f.read_record()  # version
+        f.read_markers([-1, 0])
+
+    def _read_table_name(self):
+        marker = self.file.peek_marker()
+
+        # the file ends with a 0 marker
+        if marker is None or marker == 0:
+            return None
+
+        return self.file.read_record()[:8].strip()
+
+    def _skip_table(self):
+        f = self.file
+        f.read_markers([-1])
+        f.skip_record()
+        f.read_markers([-2, 1, 0])
+        f.skip_record()
+
+        isubtable = -3
+        self._read_subtable_markers(isubtable)
+
+        while True:
+            marker = f.peek_marker()
+            if marker == 0:
+                break
+
+            # a negative marker is the start of the next subtable (e.g., the PCOMPTS has empty subtables)
+            if marker > 0:
+                f.skip_record()
+            isubtable -= 1
+            self._read_subtable_markers(isubtable)
+
+        f.read_markers([0])
+
+    def _read_subtable_markers(self, isubtable):
+        # the 3rd marker is 0 for tables and 1 for matrices
+        self.file.read_markers([isubtable, 1])
+        self.file.read_marker()
+
+    def _read_result_table(self, table_name):
+        f = self.file
+        f.read_markers([-1])
+        f.skip_record()
+        f.read_markers([-2, 1, 0])
+        f.skip_record()
+
+        isubtable = -3
+        self._read_subtable_markers(isubtable)
+
+        # the subtables alternate between table 3 (ident) and table 4 (data)
+        header = None
+
+        while True:
+            marker = f.peek_marker()
+            if marker == 0:
+                break
+
+            # a negative marker is the start of the next subtable
+            if marker > 0:
+                if header is None:
+                    ident = f.read_record()
+                    if len(ident) != _table3_nbytes:
+                        raise Exception('Error reading op2 file %s!  Table %s has an invalid table 3 record.' % (
+                            f.filename, table_name.decode('latin1')))
+                    header = OP2HeaderData(table_name, ident, f.endian)
+                else:
+                    self._read_table4(header)
+                    header = None
+
+            isubtable -= 1
+            self._read_subtable_markers(isubtable)
+
+        f.read_markers([0])
+
+    def _read_table4(self, header):
+        f = self.file
+
+        if not header.is_supported:
+            f.skip_record()
+            self._callback(OP2TableData(header))
+            return
+
+        dtype = np.dtype(f.endian + 'i4')
+        num_wide = header.num_wide
+        row_nbytes = 4 * num_wide
+        chunk_nbytes = self.chunk_size * row_nbytes
+
+        blocks = []
+        nbytes = 0
+
+        for block in f.iter_record():
+            blocks.append(block)
+            nbytes += len(block)
+
+            if nbytes < chunk_nbytes:
+                continue
+
+            data = b''.join(blocks)
+            i = 0
+            while nbytes - i >= chunk_nbytes:
+                self._write_chunk(header, np.frombuffer(data, dtype=dtype, count=self.chunk_size * num_wide,
+                                                        offset=i), num_wide)
+                i += chunk_nbytes
+
+            # a row may be split across blocks
+            blocks = [data[i:]]
+            nbytes -= i
+
+        if nbytes > 0:
+            data = b''.join(blocks)
+            if nbytes % row_nbytes != 0:
+                raise Exception('Error reading op2 file %s!  Table %s has %d bytes, which is not a multiple of '
+                                'num_wide=%d.' % (f.filename, header.table_name.decode('latin1'), nbytes, num_wide))
+            self._write_chunk(header, np.frombuffer(data, dtype=dtype), num_wide)
 
-    def _read_data_block(self):
-        # if self.file.tell() == 0:
-        #     return self._read_header()
-        # otherwise read some data block
-        pass
+    def _write_chunk(self, header, words, num_wide):
+        # the h5 tables are little endian
+        words = words.astype('<i4', copy=False).reshape(-1, num_wide)
+        self._callback(OP2TableData(header, words))
@@ -0,0 +1,190 @@
+from __future__ import print_function, absolute_import
+
+import numpy as np
+
+
+# table_code: results type of the nodal result tables
+_nodal_results_types = {
+    1: 'DISPLACEMENTS',
+    2: 'OLOADS',
+    3: 'SPCF',
+    7: 'EIGENVECTORS',
+    10: 'VELOCITIES',
+    11: 'ACCELERATIONS',
+    19: 'GRID POINT FORCE BALANCE',
+    39: 'MPCF',
+}
+
+# table_code: results type of the element result tables
+_elemental_results_types = {
+    4: 'FORCES',
+    5: 'STRESSES',
+}
+
+# the nodal tables that don't have a grid type after the id
+_no_grid_type_table_codes = {19}
+
+# analysis codes where the 5th word of table 3 is a float (frequency, time, load factor)
+_float_analysis_codes = {5, 6, 10, 11}
+
+
+class OP2HeaderData(object):
+    """
+    The table 3 (ident) record of a result table.
+    """
+    def __init__(self, table_name=b'', ident=None, endian='<'):
+        self.table_name = table_name
+        self.title = ''
+        self.subtitle = ''
+        self.label = ''
+        self.approach_code = 0
+        self.table_code = 0
+        self.sort_code = 0
+        self.element_type = 0
+        self._subcase_id = 0
+        self._field5 = 0
+        self.format_code = 0
+        self.num_wide = 0
+        self.s_code = 0
+
+        if ident is not None:
+            self.set_data(ident, endian)
+
+    def set_data(self, ident, endian):
+        ints = np.frombuffer(ident, dtype=endian + 'i4', count=11)
+        floats = np.frombuffer(ident, dtype=endian + 'f4', count=11)
+
+        approach_code, tcode, element_type, subcase_id = ints[:4].tolist()
+
+        self.approach_code = approach_code
+        self.table_code = tcode % 1000
+        self.sort_code = tcode // 1000
+        self.element_type = element_type
+        self._subcase_id = subcase_id
+
+        if self.analysis_code in _float_analysis_codes:
+            self._field5 = float(floats[4])
+        else:
+            self._field5 = int(ints[4])
+
+        self.format_code = int(ints[8])
+        self.num_wide = int(ints[9])
+        self.s_code = int(ints[10])
+
+        self.title = ident[200:328].decode('latin1').strip()
+        self.subtitle = ident[328:456].decode('latin1').strip()
+        self.label = ident[456:584].decode('latin1').strip()
+
+    def __str__(self):
+        return 'TABLE=%s, TITLE=%s, SUBTITLE=%s, LABEL=%s, SUBCASE ID=%s, Results Type=%s, NUM_WIDE=%d' % (
+            self.table_name.decode('latin1'), self.title, self.subtitle, self.label, self.subcase_id,
+            self.results_type, self.num_wide
+        )
+
+    @property
+    def analysis_code(self):
+        return self.approach_code // 10
+
+    @property
+    def is_real(self):
+        # the format code is 1 for the frequency/complex eigenvalue tables, so the complex
+        # tables are found from the sort code (1/3) and the analysis code like pyNastran
+        return self.sort_code not in (1, 3) and self.analysis_code not in (5, 9)
+
+    @property
+    def is_sort1(self):
+        return self.sort_code not in (2, 3, 6)
+
+    @property
+    def is_strain(self):
+        return self.table_code == 5 and (self.table_name.startswith(b'OSTR') or self.s_code & 8 != 0)
+
+    @property
+    def is_elemental(self):
+        return self.table_code in _elemental_results_types
+
+    @property
+    def has_grid_type(self):
+        """is the 2nd word of a row the grid type (e.g., G, S)"""
+        return not self.is_elemental and self.table_code not in _no_grid_type_table_codes
+
+    @property
+    def is_supported(self):
+        """can the table 4 data be read"""
+        if not (self.is_real and self.is_sort1):
+            return False
+        if self.is_elemental:
+            return self.element_type > 0
+        return self.table_code in _nodal_results_types
+
+    @property
+    def options(self):
+        # the von mises/max shear flag is the only one that changes the layout (e.g., for the QUAD4)
+        if self.table_code != 5:
+            return set()
+        if self.s_code & 1:
+            return {'VONM'}
+        return {'MAXS'}
+
+    @property
+    def load_factor(self):
+        """the load factor, time, frequency or mode of the subcase; statics are 1."""
+        if self.analysis_code == 1:
+            return 1.
+        return float(self._field5)
+
+    @property
+    def subcase_id_num(self):
+        return self._subcase_id
+
+    @property
+    def subcase_id(self):
+        if self.analysis_code == 1:
+            return str(self._subcase_id)
+        return '%s Load Factor=%s' % (self._subcase_id, self.load_factor)
+
+    @property
+    def results_type(self):
+        if self.is_elemental:
+            results_type = _elemental_results_types[self.table_code]
+            if self.is_strain:
+                results_type = 'STRAINS'
+            results_type = 'ELEMENT %s %d' % (results_type, self.element_type)
+        else:
+            try:
+                results_type = _nodal_results_types[self.table_code]
+                # the mpc forces use the spc force table code
+                if self.table_name.startswith(b'OQMG'):
+                    results_type = 'MPCF'
+            except KeyError:
+                results_type = '%s TABLE CODE %d' % (self.table_name.decode('latin1'), self.table_code)
+
+        if self.is_real:
+            results_type = '%s REAL' % results_type
+        else:
+            results_type = '%s COMPLEX' % results_type
+
+        if not self.is_sort1:
+            results_type = '%s SORT2' % results_type
+
+        return results_type
+
+    @property
+    def results_type_basic(self):
+        # op2 element tables don't have the element name, so it's already the basic type
+        return self.results_type
+
+
+class OP2TableData(object):
+    """
+    A chunk of the table 4 (data) record of a result table.
+
+    data is a (nrows, num_wide) int32 array of the raw words of the rows; the float
+    columns are read with data[:, i].view('<f4').  data is None for the tables that
+    aren't read (e.g., complex or SORT2 results), so only the header is available.
+    """
+    def __init__(self, header=None, data=None):
+        if header is None:
+            header = OP2HeaderData()
+        self.header = header
+        self.data = data
@@ -0,0 +1,108 @@
+"""tests for streaming an op2 into the h5 result tables"""
+from __future__ import print_function, absolute_import
+
+import os
+import unittest
+
+import numpy as np
+from cpylog import get_logger
+
+try:
+    import tables  # pylint: disable=unused-import
+    IS_TABLES = True
+except ImportError:  # pragma: no cover
+    IS_TABLES = False
+
+if IS_TABLES:
+    from h5Nastran import H5Nastran
+    from h5Nastran.post_process.result_readers.op2 import OP2Reader
+
+import pyNastran
+from pyNastran.op2.op2 import read_op2
+
+PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.join(PKG_PATH, '..', 'models')
+
+
+class TestLoadOP2(unittest.TestCase):
+
+    def setUp(self):
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        self.bdf_filename = os.path.join(folder, 'static_solid_shell_bar.bdf')
+        self.op2_filename = os.path.join(folder, 'static_solid_shell_bar.op2')
+
+        log = get_logger(level='error')
+        model = read_op2(self.op2_filename, debug=False, log=log, build_dataframe=False)
+        self.displacements = model.displacements[1]
+
+    @unittest.skipIf(not IS_TABLES, "No tables")
+    def test_op2_reader_chunks(self):
+        """the rows of a table are streamed in chunks of chunk_size rows"""
+        chunks = []
+
+        def callback(table_data):
+            if table_data.header.results_type_basic == 'DISPLACEMENTS REAL':
+                chunks.append(table_data.data)
+
+        reader = OP2Reader(self.op2_filename, chunk_size=2)
+        reader.register_callback(callback)
+        reader.read()
+        reader.close()
+
+        assert max(len(chunk) for chunk in chunks) == 2, [len(chunk) for chunk in chunks]
+        data = np.vstack(chunks)
+        nids = data[:, 0] // 10
+        assert np.array_equal(nids, self.displacements.node_gridtype[:, 0]), nids
+        translations = data[:, 2:5].view('<f4')
+        assert np.array_equal(translations, self.displacements.data[0, :, :3])
+
+    @unittest.skipIf(not IS_TABLES, "No tables")
+    def test_load_op2(self):
+        """the streamed displacements match read_op2"""
+        db = H5Nastran('static_solid_shell_bar.h5', 'w', in_memory=True)
+        db.load_bdf(self.bdf_filename)
+        db.load_op2(self.op2_filename)
+
+        table = db.h5f.get_node('/NASTRAN/RESULT/NODAL/DISPLACEMENT')
+        data = table.read()
+        db.close()
+
+        assert np.array_equal(data['ID'], self.displacements.node_gridtype[:, 0]), data['ID']
+        assert np.all(data['DOMAIN_ID'] == 1), data['DOMAIN_ID']
+        assert np.allclose(data['X'], self.displacements.data[0, :, 0])
+        assert np.allclose(data['RZ'], self.displacements.data[0, :, 5])
+
+    @unittest.skipIf(not IS_TABLES, "No tables")
+    def test_load_op2_freq(self):
+        """the complex tables of a frequency response aren't written to the real tables"""
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        bdf_filename = os.path.join(folder, 'freq_solid_shell_bar.bdf')
+        op2_filename = os.path.join(folder, 'freq_solid_shell_bar.op2')
+
+        headers = []
+
+        def callback(table_data):
+            if table_data.header.results_type_basic.startswith('DISPLACEMENTS'):
+                headers.append(table_data.header)
+
+        reader = OP2Reader(op2_filename)
+        reader.register_callback(callback)
+        reader.read()
+        reader.close()
+
+        assert len(headers) > 0
+        assert not any(header.is_real for header in headers), [header.num_wide for header in headers]
+
+        db = H5Nastran('freq_solid_shell_bar.h5', 'w', in_memory=True)
+        db.load_bdf(bdf_filename)
+        db.load_op2(op2_filename)
+        is_displacement = '/NASTRAN/RESULT/NODAL/DISPLACEMENT' in db.h5f
+        is_spc_force = '/NASTRAN/RESULT/NODAL/SPC_FORCE' in db.h5f
+        db.close()
+
+        assert not is_displacement
+        assert not is_spc_force
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()